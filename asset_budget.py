@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+SkiAvax Asset Budget Report
+Reads assets/manifest.json and each PNG header, then reports what the manifest
+costs at runtime: decoded texture memory (w×h×4), compressed transfer bytes and
+request count, per asset and per game state. Exits non-zero when a budget is
+exceeded, so heavy additions are caught at build time.
+
+    python3 asset_budget.py                       # default budgets
+    python3 asset_budget.py --device-class low    # apply the manifest's "_lod" overrides
+    python3 asset_budget.py --budgets budgets.json
+"""
+import argparse
+import json
+import struct
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent
+MANIFEST_FILE = ROOT_DIR / 'assets' / 'manifest.json'
+
+# Manifest key prefixes each game state draws (kept by hand in step with the
+# assets.get() calls in js/states/). Everything in the manifest is fetched up
+# front by Game.start() before MenuState is entered, so the "boot" group (all
+# assets) is what actually has to fit on the device.
+STATE_ASSETS = {
+    'MenuState': ('bg_menu',),
+    'PlayState': ('player_', 'obstacle_', 'collectible_', 'npc_', 'boss_', 'ramp', 'gate_flag', 'fx_', 'font_'),
+    'GameOverState': ('bg_gameover', 'font_'),
+    'LeaderboardState': ('bg_leaderboard', 'font_'),
+}
+
+# Limits in bytes / requests. Override any subset with --budgets FILE, e.g.
+# {"asset": {"decoded": "128KB"}, "groups": {"PlayState": {"requests": 40}}}
+DEFAULT_BUDGETS = {
+    'asset': {'decoded': '256KB', 'transfer': '64KB'},
+    'boot': {'decoded': '8MB', 'transfer': '2MB', 'requests': 64},
+    'groups': {},
+}
+
+ASSET_METRICS = ('decoded', 'transfer')
+GROUP_METRICS = ('decoded', 'transfer', 'requests')
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+UNITS = {'B': 1, 'KB': 1024, 'MB': 1024 ** 2, 'GB': 1024 ** 3}
+
+
+def parse_size(value):
+    """Accept ints or strings like '512KB' / '2MB' (binary units)."""
+    if isinstance(value, (int, float)):
+        return int(value)
+    text = str(value).strip().upper()
+    for unit in ('GB', 'MB', 'KB', 'B'):
+        if text.endswith(unit):
+            return int(float(text[:-len(unit)]) * UNITS[unit])
+    return int(text)
+
+
+def fmt_size(n):
+    for unit in ('MB', 'KB'):
+        if n >= UNITS[unit]:
+            return f'{n / UNITS[unit]:.1f} {unit}'
+    return f'{n} B'
+
+
+def png_size(path):
+    """Return (width, height) from a PNG's IHDR chunk."""
+    with open(path, 'rb') as f:
+        head = f.read(24)
+    if len(head) < 24 or head[:8] != PNG_SIGNATURE or head[12:16] != b'IHDR':
+        raise ValueError('not a PNG file')
+    return struct.unpack('>II', head[16:24])
+
+
+def load_assets(manifest_path, device_class):
+    """Return a list of per-asset dicts (key, path, w, h, decoded, transfer, error)."""
+    manifest = json.loads(Path(manifest_path).read_text(encoding='utf-8'))
+    overrides = manifest.get('_lod', {}).get(device_class, {})
+    assets = []
+    for key, rel in manifest.items():
+        if key.startswith('_'):
+            continue
+        rel = overrides.get(key, rel)
+        path = ROOT_DIR / rel
+        asset = {'key': key, 'path': rel, 'w': 0, 'h': 0, 'decoded': 0, 'transfer': 0, 'error': None}
+        try:
+            asset['w'], asset['h'] = png_size(path)
+            asset['decoded'] = asset['w'] * asset['h'] * 4
+            asset['transfer'] = path.stat().st_size
+        except (OSError, ValueError) as e:
+            asset['error'] = str(e)
+        assets.append(asset)
+    return assets
+
+
+def group_totals(assets):
+    """Totals for the boot load and for each game state's asset subset."""
+    groups = {'boot': assets}
+    for state, prefixes in STATE_ASSETS.items():
+        groups[state] = [a for a in assets if prefixes and a['key'].startswith(prefixes)]
+    return {
+        name: {
+            'decoded': sum(a['decoded'] for a in members),
+            'transfer': sum(a['transfer'] for a in members),
+            'requests': len(members),
+        }
+        for name, members in groups.items()
+    }
+
+
+def check_budgets(assets, totals, budgets):
+    """Return a list of human-readable budget violations."""
+    failures = []
+    for metric in budgets['asset']:
+        if metric not in ASSET_METRICS:
+            failures.append(f"asset: unknown metric {metric!r} in budgets (use {', '.join(ASSET_METRICS)})")
+    for a in assets:
+        if a['error']:
+            failures.append(f"{a['key']}: cannot read {a['path']} ({a['error']})")
+            continue
+        for metric, limit in budgets['asset'].items():
+            if metric in ASSET_METRICS and a[metric] > limit:
+                failures.append(f"{a['key']}: {metric} {fmt_size(a[metric])} > {fmt_size(limit)}")
+    group_limits = dict(budgets['groups'])
+    group_limits['boot'] = {**budgets['boot'], **group_limits.get('boot', {})}
+    for name, limits in group_limits.items():
+        if name not in totals:
+            failures.append(f'{name}: unknown group in budgets')
+            continue
+        for metric, limit in limits.items():
+            if metric not in GROUP_METRICS:
+                failures.append(f"{name}: unknown metric {metric!r} in budgets (use {', '.join(GROUP_METRICS)})")
+                continue
+            value = totals[name][metric]
+            if value > limit:
+                shown = (value, limit) if metric == 'requests' else (fmt_size(value), fmt_size(limit))
+                failures.append(f'{name}: {metric} {shown[0]} > {shown[1]}')
+    return failures
+
+
+def parse_limit(where, metric, value):
+    """Parse one budget limit to a non-negative int (bytes, or a request count)."""
+    try:
+        if isinstance(value, bool) or (metric == 'requests' and isinstance(value, float)):
+            raise ValueError
+        n = int(str(value).strip()) if metric == 'requests' else parse_size(value)
+    except (ValueError, OverflowError):
+        raise ValueError(f'{where}.{metric}: bad limit {value!r}') from None
+    if n < 0:
+        raise ValueError(f'{where}.{metric}: limit must be >= 0, got {value!r}')
+    return n
+
+
+def load_budgets(path):
+    """Default budgets overlaid with the JSON file at path, every limit parsed.
+
+    Anything malformed raises ValueError, so main() reports it as a usage
+    error (exit 2) rather than crashing or counting it as a violation.
+    """
+    budgets = json.loads(json.dumps(DEFAULT_BUDGETS))
+    if path:
+        custom = json.loads(Path(path).read_text(encoding='utf-8'))
+        if not isinstance(custom, dict):
+            raise ValueError(f'{path}: budgets must be a JSON object')
+        unknown = set(custom) - set(DEFAULT_BUDGETS)
+        if unknown:
+            raise ValueError(f'{path}: unknown section(s) {", ".join(sorted(unknown))} '
+                             f'(use {", ".join(DEFAULT_BUDGETS)})')
+        for section, limits in custom.items():
+            if not isinstance(limits, dict):
+                raise ValueError(f'{path}: "{section}" must be a JSON object')
+        for name, limits in custom.get('groups', {}).items():
+            if not isinstance(limits, dict):
+                raise ValueError(f'{path}: groups.{name} must be a JSON object')
+        for section in ('asset', 'boot'):
+            budgets[section].update(custom.get(section, {}))
+        budgets['groups'].update(custom.get('groups', {}))
+    return {
+        'asset': {m: parse_limit('asset', m, v) for m, v in budgets['asset'].items()},
+        'boot': {m: parse_limit('boot', m, v) for m, v in budgets['boot'].items()},
+        'groups': {name: {m: parse_limit(f'groups.{name}', m, v) for m, v in limits.items()}
+                   for name, limits in budgets['groups'].items()},
+    }
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Report SkiAvax texture memory and load budgets.')
+    ap.add_argument('--manifest', default=str(MANIFEST_FILE), help='manifest.json to analyse')
+    ap.add_argument('--device-class', default='default',
+                    help='apply the manifest\'s "_lod" overrides for this class (e.g. low)')
+    ap.add_argument('--budgets', help='JSON file overriding the default budgets')
+    args = ap.parse_args(argv)
+
+    try:
+        assets = load_assets(args.manifest, args.device_class)
+        budgets = load_budgets(args.budgets)
+    except (OSError, ValueError) as e:
+        print(f'❌ Error: {e}')
+        return 2
+
+    print('=' * 72)
+    print(f'📊 SkiAvax Asset Budget ({args.device_class})')
+    print('=' * 72)
+    print(f"{'key':<22} {'size':>9} {'decoded':>11} {'transfer':>11}")
+    for a in sorted(assets, key=lambda a: -a['decoded']):
+        size = f"{a['w']}×{a['h']}" if not a['error'] else 'missing'
+        print(f"{a['key']:<22} {size:>9} {fmt_size(a['decoded']):>11} {fmt_size(a['transfer']):>11}")
+    print()
+
+    totals = group_totals(assets)
+    print(f"{'group':<22} {'requests':>9} {'decoded':>11} {'transfer':>11}")
+    for name, t in totals.items():
+        print(f"{name:<22} {t['requests']:>9} {fmt_size(t['decoded']):>11} {fmt_size(t['transfer']):>11}")
+    print()
+
+    failures = check_budgets(assets, totals, budgets)
+    if failures:
+        print(f'❌ {len(failures)} budget violation(s):')
+        for f in failures:
+            print(f'  - {f}')
+        return 1
+    print('✓ All assets within budget')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""SkiAvax — 5×7 pixel bitmap font, Python stdlib only.
+
+Builds the glyph atlas + JSON metrics/kerning table the JS BitmapFont blits
+from at runtime, and lays out glyph runs so static strings (logo text,
+titles) can be baked straight into sprites by generate_sprites.py.
+
+Buffers are the same flat lists of (r, g, b, a) tuples the generators use.
+"""
+
+GLYPH_H  = 7    # cap height in font pixels (no descenders)
+SPACING  = 1    # blank columns between glyphs
+SPACE_W  = 3    # advance of ' ' before spacing
+LINE_GAP = 2    # extra rows between lines
+
+# '#' = ink, one string per row. A glyph's width is the length of its row strings,
+# so narrow characters (I, 1, punctuation) are simply drawn narrower and get
+# proportional advances from that.
+GLYPHS = {
+    'A': ['.###.', '#...#', '#...#', '#####', '#...#', '#...#', '#...#'],
+    'B': ['####.', '#...#', '#...#', '####.', '#...#', '#...#', '####.'],
+    'C': ['.###.', '#...#', '#....', '#....', '#....', '#...#', '.###.'],
+    'D': ['####.', '#...#', '#...#', '#...#', '#...#', '#...#', '####.'],
+    'E': ['#####', '#....', '#....', '####.', '#....', '#....', '#####'],
+    'F': ['#####', '#....', '#....', '####.', '#....', '#....', '#....'],
+    'G': ['.###.', '#...#', '#....', '#.###', '#...#', '#...#', '.####'],
+    'H': ['#...#', '#...#', '#...#', '#####', '#...#', '#...#', '#...#'],
+    'I': ['###', '.#.', '.#.', '.#.', '.#.', '.#.', '###'],
+    'J': ['..###', '...#.', '...#.', '...#.', '...#.', '#..#.', '.##..'],
+    'K': ['#...#', '#..#.', '#.#..', '##...', '#.#..', '#..#.', '#...#'],
+    'L': ['#....', '#....', '#....', '#....', '#....', '#....', '#####'],
+    'M': ['#...#', '##.##', '#.#.#', '#.#.#', '#...#', '#...#', '#...#'],
+    'N': ['#...#', '#...#', '##..#', '#.#.#', '#..##', '#...#', '#...#'],
+    'O': ['.###.', '#...#', '#...#', '#...#', '#...#', '#...#', '.###.'],
+    'P': ['####.', '#...#', '#...#', '####.', '#....', '#....', '#....'],
+    'Q': ['.###.', '#...#', '#...#', '#...#', '#.#.#', '#..#.', '.##.#'],
+    'R': ['####.', '#...#', '#...#', '####.', '#.#..', '#..#.', '#...#'],
+    'S': ['.####', '#....', '#....', '.###.', '....#', '....#', '####.'],
+    'T': ['#####', '..#..', '..#..', '..#..', '..#..', '..#..', '..#..'],
+    'U': ['#...#', '#...#', '#...#', '#...#', '#...#', '#...#', '.###.'],
+    'V': ['#...#', '#...#', '#...#', '#...#', '#...#', '.#.#.', '..#..'],
+    'W': ['#...#', '#...#', '#...#', '#.#.#', '#.#.#', '##.##', '#...#'],
+    'X': ['#...#', '#...#', '.#.#.', '..#..', '.#.#.', '#...#', '#...#'],
+    'Y': ['#...#', '#...#', '.#.#.', '..#..', '..#..', '..#..', '..#..'],
+    'Z': ['#####', '....#', '...#.', '..#..', '.#...', '#....', '#####'],
+    '0': ['.###.', '#...#', '#..##', '#.#.#', '##..#', '#...#', '.###.'],
+    '1': ['.#.', '##.', '.#.', '.#.', '.#.', '.#.', '###'],
+    '2': ['.###.', '#...#', '....#', '...#.', '..#..', '.#...', '#####'],
+    '3': ['####.', '....#', '....#', '.###.', '....#', '....#', '####.'],
+    '4': ['...#.', '..##.', '.#.#.', '#..#.', '#####', '...#.', '...#.'],
+    '5': ['#####', '#....', '####.', '....#', '....#', '#...#', '.###.'],
+    '6': ['..##.', '.#...', '#....', '####.', '#...#', '#...#', '.###.'],
+    '7': ['#####', '....#', '...#.', '..#..', '.#...', '.#...', '.#...'],
+    '8': ['.###.', '#...#', '#...#', '.###.', '#...#', '#...#', '.###.'],
+    '9': ['.###.', '#...#', '#...#', '.####', '....#', '...#.', '.##..'],
+    '.': ['.', '.', '.', '.', '.', '.', '#'],
+    ',': ['..', '..', '..', '..', '..', '.#', '#.'],
+    ':': ['.', '.', '#', '.', '.', '#', '.'],
+    '!': ['#', '#', '#', '#', '#', '.', '#'],
+    '?': ['.###.', '#...#', '....#', '...#.', '..#..', '.....', '..#..'],
+    "'": ['#', '#', '.', '.', '.', '.', '.'],
+    '-': ['...', '...', '...', '###', '...', '...', '...'],
+    '+': ['.....', '..#..', '..#..', '#####', '..#..', '..#..', '.....'],
+    '/': ['....#', '...#.', '...#.', '..#..', '.#...', '.#...', '#....'],
+    '%': ['##..#', '##..#', '...#.', '..#..', '.#...', '#..##', '#..##'],
+    '(': ['.#', '#.', '#.', '#.', '#.', '#.', '.#'],
+    ')': ['#.', '.#', '.#', '.#', '.#', '.#', '#.'],
+    '#': ['.#.#.', '.#.#.', '#####', '.#.#.', '#####', '.#.#.', '.#.#.'],
+    'x': ['.....', '.....', '#...#', '.#.#.', '..#..', '.#.#.', '#...#'],
+}
+
+# Pair adjustments in font pixels, applied between the two glyphs' advances.
+KERNING = {
+    'AV': -1, 'VA': -1, 'AT': -1, 'TA': -1, 'AY': -1, 'YA': -1,
+    'LT': -1, 'LV': -1, 'LY': -1, 'FA': -1, 'PA': -1,
+    'T.': -1, 'T,': -1, 'V.': -1, 'Y.': -1, 'P.': -1, 'F.': -1,
+}
+
+def glyph(ch):
+    """Return the bitmap rows for ch (lowercase falls back to capitals)."""
+    if ch in GLYPHS:
+        return GLYPHS[ch]
+    return GLYPHS.get(ch.upper(), GLYPHS['?'])
+
+def advance(ch):
+    return (SPACE_W if ch == ' ' else len(glyph(ch)[0])) + SPACING
+
+def layout(text, scale=1):
+    """Lay out a single-line glyph run.
+
+    Returns ([(ch, x), ...], width) in output pixels; spaces are skipped in
+    the list but still advance the pen. Width excludes the trailing spacing.
+    """
+    run, pen = [], 0
+    for i, ch in enumerate(text):
+        if ch != ' ':
+            run.append((ch, pen * scale))
+        pen += advance(ch)
+        if i + 1 < len(text):
+            pen += KERNING.get(text[i:i + 2], 0)
+    return run, max(0, pen - SPACING) * scale
+
+def draw_text(b, w, x, y, text, c, scale=1):
+    """Draw text into buffer b (width w) with its top-left at (x, y). Returns width."""
+    run, width = layout(text, scale)
+    h = len(b) // w
+    for ch, gx in run:
+        for gy, row in enumerate(glyph(ch)):
+            for col, bit in enumerate(row):
+                if bit != '#':
+                    continue
+                for dy in range(scale):
+                    for dx in range(scale):
+                        px, py = x + gx + col * scale + dx, y + gy * scale + dy
+                        if 0 <= px < w and 0 <= py < h:
+                            b[py * w + px] = c
+    return width
+
+def build_atlas(pad=1, columns=16, color=(255, 255, 255, 255)):
+    """Rasterise every glyph into one atlas.
+
+    Returns (w, h, buf, metrics); metrics is the JSON-ready table the JS
+    BitmapFont reads (glyph rects, advances, kerning).
+    """
+    chars = sorted(GLYPHS)
+    cell_w = max(len(rows[0]) for rows in GLYPHS.values()) + pad * 2
+    cell_h = GLYPH_H + pad * 2
+    rows_n = (len(chars) + columns - 1) // columns
+    w, h = cell_w * columns, cell_h * rows_n
+    buf = [(0, 0, 0, 0)] * (w * h)
+    glyphs = {' ': {'x': 0, 'y': 0, 'w': 0, 'h': 0, 'advance': advance(' ')}}
+    for i, ch in enumerate(chars):
+        ox = (i % columns) * cell_w + pad
+        oy = (i // columns) * cell_h + pad
+        rows = GLYPHS[ch]
+        for gy, row in enumerate(rows):
+            for gx, bit in enumerate(row):
+                if bit == '#':
+                    buf[(oy + gy) * w + ox + gx] = color
+        glyphs[ch] = {'x': ox, 'y': oy, 'w': len(rows[0]), 'h': GLYPH_H, 'advance': advance(ch)}
+    metrics = {
+        'height': GLYPH_H,
+        'lineHeight': GLYPH_H + LINE_GAP,
+        'spacing': SPACING,
+        'glyphs': glyphs,
+        'kerning': dict(KERNING),
+    }
+    return w, h, buf, metrics
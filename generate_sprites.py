@@ -1,11 +1,14 @@
 #!/usr/bin/env python3
 """SkiAvax — Generate all game sprites using Python stdlib only (no PIL).
 Run from the project root: python3 generate_sprites.py
+Iterate on art with:      python3 generate_sprites.py --watch
 """
-import struct, zlib, os, math
+import struct, zlib, os, math, ast, json, sys, time, argparse, traceback, importlib
+import bitmap_font
 
 BASE    = os.path.dirname(os.path.abspath(__file__))
 SPRITES = os.path.join(BASE, 'assets', 'sprites')
+MANIFEST = os.path.join(BASE, 'assets', 'manifest.json')
 
 # ── Palette ──────────────────────────────────────────────────────────────────
 T    = (0,0,0,0)           # transparent
@@ -40,20 +43,71 @@ LGRY = (200,210,225,255)   # light grey
 YLW  = (255,240,0,255)     # yellow
 PINK2= (255,180,200,255)   # light pink
 
-# ── PNG writer ───────────────────────────────────────────────────────────────
+# ── PNG I/O ──────────────────────────────────────────────────────────────────
 def make_png(w, h, buf):
     def ck(t, d):
         return struct.pack('>I', len(d)) + t + d + struct.pack('>I', zlib.crc32(t + d) & 0xffffffff)
-    raw = b''
-    for y in range(h):
-        raw += b'\x00'
-        for x in range(w):
-            raw += bytes(buf[y * w + x])
+    raw = b''.join(b'\x00' + b''.join(map(bytes, buf[y * w:(y + 1) * w])) for y in range(h))
     return (b'\x89PNG\r\n\x1a\n'
             + ck(b'IHDR', struct.pack('>IIBBBBB', w, h, 8, 6, 0, 0, 0))
             + ck(b'IDAT', zlib.compress(raw, 9))
             + ck(b'IEND', b''))
 
+def read_png(path):
+    """Return (w, h, buf) for an 8-bit RGB/RGBA, non-interlaced PNG."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if data[:8] != b'\x89PNG\r\n\x1a\n':
+        raise ValueError(f'{path}: not a PNG file')
+    pos, idat, head = 8, [], None
+    while pos < len(data):
+        n, t = struct.unpack('>I4s', data[pos:pos + 8])
+        if t == b'IHDR':
+            head = struct.unpack('>IIBBBBB', data[pos + 8:pos + 21])
+        elif t == b'IDAT':
+            idat.append(data[pos + 8:pos + 8 + n])
+        elif t == b'IEND':
+            break
+        pos += n + 12
+    if head is None:
+        raise ValueError(f'{path}: missing IHDR')
+    w, h, depth, ctype, _, _, interlace = head
+    if depth != 8 or ctype not in (2, 6) or interlace:
+        raise ValueError(f'{path}: unsupported PNG (depth {depth}, color type {ctype}, interlace {interlace})')
+    bpp = 4 if ctype == 6 else 3
+    stride = w * bpp
+    raw = zlib.decompress(b''.join(idat))
+    prev = bytearray(stride)
+    px = bytearray()
+    for y in range(h):
+        ft = raw[y * (stride + 1)]
+        row = bytearray(raw[y * (stride + 1) + 1:(y + 1) * (stride + 1)])
+        if ft == 1:
+            for i in range(bpp, stride):
+                row[i] = (row[i] + row[i - bpp]) & 255
+        elif ft == 2:
+            for i in range(stride):
+                row[i] = (row[i] + prev[i]) & 255
+        elif ft == 3:
+            for i in range(stride):
+                left = row[i - bpp] if i >= bpp else 0
+                row[i] = (row[i] + ((left + prev[i]) >> 1)) & 255
+        elif ft == 4:
+            for i in range(stride):
+                a = row[i - bpp] if i >= bpp else 0
+                c = prev[i - bpp] if i >= bpp else 0
+                p = a + prev[i] - c
+                pa, pb, pc = abs(p - a), abs(p - prev[i]), abs(p - c)
+                pred = a if pa <= pb and pa <= pc else prev[i] if pb <= pc else c
+                row[i] = (row[i] + pred) & 255
+        elif ft != 0:
+            raise ValueError(f'{path}: bad filter type {ft} on row {y}')
+        px += row
+        prev = row
+    it = iter(px)
+    buf = list(zip(it, it, it, it)) if bpp == 4 else [(r, g, b, 255) for r, g, b in zip(it, it, it)]
+    return w, h, buf
+
 # ── Canvas helpers ───────────────────────────────────────────────────────────
 def cv(w, h):
     return [T] * (w * h)
@@ -116,8 +170,127 @@ def save(b, w, h, path):
     os.makedirs(os.path.dirname(path), exist_ok=True)
     with open(path, 'wb') as f:
         f.write(make_png(w, h, b))
+    _SAVED.append(path)
     print(f'  ✓ {os.path.relpath(path, BASE)}')
 
+# ── LOD variants ─────────────────────────────────────────────────────────────
+# Every PNG listed in the manifest also gets a half-size copy under a sibling
+# lod/ folder, listed in the manifest's "_lod" section so AssetManager can pick
+# it on low-memory devices (¼ of the decoded RGBA bytes). The copies are made
+# from the files the manifest points at (hand-authored or generated), so they
+# always match what ships. Sprites are drawn at their entity size in JS, so
+# the smaller image needs no code changes to display.
+NO_LOD = ('bg_', 'font_')   # manifest keys drawn 1:1 (tiled backgrounds, glyph atlas)
+
+def lod_path(path):
+    return os.path.join(os.path.dirname(path), 'lod', os.path.basename(path))
+
+def downsample(b, w, h):
+    """Return (buf, w, h) at half size: 2×2 box filter on premultiplied alpha.
+
+    Odd edges average only the samples that exist, so they don't fade out.
+    """
+    hw, hh = (w + 1) // 2, (h + 1) // 2
+    out = []
+    for y in range(hh):
+        for x in range(hw):
+            r = g = bl = a = n = 0
+            for sy in range(2 * y, min(2 * y + 2, h)):
+                for sx in range(2 * x, min(2 * x + 2, w)):
+                    pr, pg, pb, pa = b[sy * w + sx]
+                    r += pr * pa; g += pg * pa; bl += pb * pa
+                    a += pa; n += 1
+            if a == 0:
+                out.append(T)
+            else:
+                out.append((round(r / a), round(g / a), round(bl / a), round(a / n)))
+    return out, hw, hh
+
+def write_lods():
+    """Write the lod/ copy of every manifest PNG, then the manifest's "_lod" section."""
+    with open(MANIFEST, encoding='utf-8') as f:
+        manifest = json.load(f)
+    low = {}
+    for key, rel in manifest.items():
+        if key.startswith('_') or key.startswith(NO_LOD):
+            continue
+        src = os.path.join(BASE, rel)
+        try:
+            w, h, buf = read_png(src)
+        except (OSError, ValueError, zlib.error) as e:
+            print(f'  ! {key}: no LOD ({e})')
+            continue
+        half, hw, hh = downsample(buf, w, h)
+        png = make_png(hw, hh, half)
+        dst = lod_path(src)
+        try:
+            with open(dst, 'rb') as f:
+                changed = f.read() != png
+        except OSError:
+            changed = True
+        if changed:
+            os.makedirs(os.path.dirname(dst), exist_ok=True)
+            with open(dst, 'wb') as f:
+                f.write(png)
+            print(f'  ✓ {os.path.relpath(dst, BASE)}  ({hw}×{hh} LOD)')
+        low[key] = lod_path(rel).replace(os.sep, '/')
+    write_lod_manifest(low)
+
+def manifest_entries(text):
+    """Return [(key, start, end)] for the top-level entries of a JSON object.
+
+    start is where the key's string begins and end is just past its value,
+    so callers can splice one entry without re-serialising the others.
+    text must already be known to parse (json.loads) as an object.
+    """
+    dec, ws = json.JSONDecoder(), ' \t\r\n'
+    pos = text.index('{') + 1
+    entries = []
+    while True:
+        while text[pos] in ws:
+            pos += 1
+        if text[pos] == '}':
+            return entries
+        start = pos
+        key, pos = dec.raw_decode(text, pos)
+        while text[pos] in ws + ':':
+            pos += 1
+        _, pos = dec.raw_decode(text, pos)
+        entries.append((key, start, pos))
+        while text[pos] in ws + ',':
+            pos += 1
+
+def write_lod_manifest(low):
+    """Set the "_lod" section of manifest.json to {"low": low}, if it changed.
+
+    The section is kept as the last entry so the hand-edited entries above
+    it (and their grouping) are left untouched. If anything follows it, the
+    manifest is left alone with a warning rather than reordered.
+    """
+    with open(MANIFEST, encoding='utf-8') as f:
+        text = f.read()
+    if json.loads(text).get('_lod', {}) == ({'low': low} if low else {}):
+        return
+    entries = manifest_entries(text)
+    keys = [key for key, _, _ in entries]
+    if '_lod' in keys:
+        i = keys.index('_lod')
+        if i != len(keys) - 1:
+            print(f'  ! {os.path.relpath(MANIFEST, BASE)}: "{keys[i + 1]}" follows "_lod"; '
+                  f'move it above the "_lod" section (not rewriting)')
+            return
+        entries = entries[:-1]
+    head = text[:entries[-1][2]] if entries else text[:text.index('{') + 1]
+    if not low:
+        text = head + '\n}\n'
+    else:
+        section = json.dumps({'low': low}, indent=4, ensure_ascii=False).replace('\n', '\n    ')
+        sep = ',\n\n    ' if entries else '\n    '
+        text = f'{head}{sep}"_lod": {section}\n}}\n'
+    with open(MANIFEST, 'w', encoding='utf-8') as f:
+        f.write(text)
+    print(f'  ✓ {os.path.relpath(MANIFEST, BASE)}  ("_lod": {len(low)} entries)')
+
 def mirror_x(b, w, h):
     """Return a horizontally mirrored copy of the buffer."""
     m = list(b)
@@ -128,6 +301,36 @@ def mirror_x(b, w, h):
             m[a], m[z] = b[z], b[a]
     return m
 
+# ── Base-buffer cache ────────────────────────────────────────────────────────
+# Shared bases (pharaoh body, NPC blobs) are drawn once per argument set and
+# reused for the life of the process. Watch mode keeps the dict alive across
+# reloads and only drops the entries whose drawing function (or anything it
+# uses) was edited. There is no on-disk tier: these layers redraw in well under
+# a millisecond, less than reading them back from any cache file would cost.
+_BASE_CACHE = {}
+_SAVED = []     # every path written by save(), in order
+
+def base_buffer(key, draw):
+    """Return the buffer for key, calling draw() the first time it's asked for."""
+    buf = _BASE_CACHE.get(key)
+    if buf is None:
+        buf = _BASE_CACHE[key] = draw()
+    return buf
+
+def cached(w, h, fn, *args):
+    """Return a fresh copy of the w×h buffer returned by fn(*args), drawing it once."""
+    return list(base_buffer((fn.__name__, w, h) + args, lambda: fn(*args)))
+
+def stamp(b, w, h, fn, *args):
+    """Copy the pixels fn(layer, *args) draws on a blank w×h layer onto b."""
+    def draw():
+        layer = cv(w, h)
+        fn(layer, *args)
+        return layer
+    for i, c in enumerate(base_buffer((fn.__name__, w, h) + args, draw)):
+        if c != T:
+            b[i] = c
+
 # ── Player: Pharaoh skier ─────────────────────────────────────────────────────
 W48 = 48
 
@@ -163,7 +366,7 @@ def pharaoh_base(b, cx=24, head_y=4):
 def make_player_dir(ski_dx_l, ski_dy_l, ski_dx_r, ski_dy_r, lean=0):
     """Draw player facing down with parameterised ski/pole direction."""
     b = cv(W48, W48)
-    pharaoh_base(b, cx=24 + lean)
+    stamp(b, W48, W48, pharaoh_base, 24 + lean, 4)
     cx = 24 + lean
     # Poles (line from hand to ground)
     px_l, py_l = cx - 9, 31   # left hand
@@ -207,7 +410,7 @@ def gen_players():
 
     # Jump: arms spread, skis angled up
     bj = cv(W48, W48)
-    pharaoh_base(bj, cx=24, head_y=2)
+    stamp(bj, W48, W48, pharaoh_base, 24, 2)
     # Arms spread wide
     line(bj, W48, 16, 29, 6,  25, SKI)
     line(bj, W48, 32, 29, 42, 25, SKI)
@@ -218,7 +421,7 @@ def gen_players():
 
     # Crash: figure lying on side, skis scattered
     bc = cv(W48, W48)
-    pharaoh_base(bc, cx=24, head_y=20)  # head now low (lying)
+    stamp(bc, W48, W48, pharaoh_base, 24, 20)  # head now low (lying)
     # Crossed skis
     line(bc, W48, 5, 14, 40, 20, SKI, 2)
     line(bc, W48, 5, 20, 40, 14, SKI, 2)
@@ -233,7 +436,7 @@ def gen_players():
     # Caught: arms flung up, purple glow around
     bca = cv(W48, W48)
     ring(bca, W48, 24, 24, 18, 22, PUR)    # purple aura
-    pharaoh_base(bca, cx=24, head_y=4)
+    stamp(bca, W48, W48, pharaoh_base, 24, 4)
     # Arms flung straight up
     line(bca, W48, 16, 31, 10, 18, SKI)
     line(bca, W48, 32, 31, 38, 18, SKI)
@@ -379,19 +582,19 @@ def gen_npcs():
     out = os.path.join(SPRITES, 'npcs')
 
     # benqi — teal/blue water-themed
-    b = npc_base(TEAL, DTEAL, 'round')
+    b = cached(40, 40, npc_base, TEAL, DTEAL, 'round')
     rect(b, 40, 16, 6, 8, 6, CYN)   # fin/wave on head
     save(b, 40, 40, os.path.join(out, 'benqi.png'))
 
     # salvor — orange, boxy
-    b = npc_base(ORG, DORG, 'square')
+    b = cached(40, 40, npc_base, ORG, DORG, 'square')
     # Hard hat
     rect(b, 40, 8, 7, 24, 5, DORG)
     rect(b, 40, 10, 4, 20, 4, ORG)
     save(b, 40, 40, os.path.join(out, 'salvor.png'))
 
     # blaze — red/orange flame shape
-    b = npc_base(ORG, RED, 'round')
+    b = cached(40, 40, npc_base, ORG, RED, 'round')
     # Flame tips on head
     tri(b, 40, [(14, 2), (10, 12), (18, 12)], RED)
     tri(b, 40, [(20, 0), (16, 10), (24, 10)], ORG)
@@ -399,21 +602,21 @@ def gen_npcs():
     save(b, 40, 40, os.path.join(out, 'blaze.png'))
 
     # arena — purple, gladiator helmet
-    b = npc_base(PUR, DPUR, 'round')
+    b = cached(40, 40, npc_base, PUR, DPUR, 'round')
     rect(b, 40, 10, 6, 20, 8, DPUR)   # helmet dome
     rect(b, 40, 8,  13, 24, 3, GLD)   # gold band
     tri(b, 40, [(20, 0), (16, 7), (24, 7)], PUR)  # crest
     save(b, 40, 40, os.path.join(out, 'arena.png'))
 
     # yieldyak — green yak-like, two horns
-    b = npc_base(GRN, DGRN, 'round')
+    b = cached(40, 40, npc_base, GRN, DGRN, 'round')
     # Horns
     tri(b, 40, [(13, 1), (10, 10), (16, 10)], DGRN)
     tri(b, 40, [(27, 1), (24, 10), (30, 10)], DGRN)
     save(b, 40, 40, os.path.join(out, 'yieldyak.png'))
 
     # dokyo — pink, round with bow on top
-    b = npc_base(PNK, DPNK, 'round')
+    b = cached(40, 40, npc_base, PNK, DPNK, 'round')
     # Bow tie on head
     tri(b, 40, [(20, 4), (12, 8), (20, 8)], RED)
     tri(b, 40, [(20, 4), (28, 8), (20, 8)], DRED)
@@ -421,7 +624,7 @@ def gen_npcs():
     save(b, 40, 40, os.path.join(out, 'dokyo.png'))
 
     # dexalot — cyan robot, antenna
-    b = npc_base(CYN, DCYN, 'square')
+    b = cached(40, 40, npc_base, CYN, DCYN, 'square')
     # Antenna
     rect(b, 40, 19, 3, 2, 7, GRY)
     circ(b, 40, 20, 3, 2, YLW)
@@ -431,7 +634,7 @@ def gen_npcs():
     save(b, 40, 40, os.path.join(out, 'dexalot.png'))
 
     # pangolin — brown, armour scales
-    b = npc_base(BRN, DBRN, 'round')
+    b = cached(40, 40, npc_base, BRN, DBRN, 'round')
     # Scale pattern
     for row in range(3):
         for col in range(3):
@@ -506,23 +709,316 @@ def gen_ui():
     # White triangle (AVAX A)
     tri(b, 128, [(24, 8), (6, 40), (42, 40)], W)
     tri(b, 128, [(24, 28), (16, 40), (32, 40)], RED)
-    # "AVAX" text area
+    # "AVAX" text area: gold "SKI" over white "AVAX", centred
     rect(b, 128, 48, 2, 76, 44, (180, 30, 30, 255))
+    ski_w = bitmap_font.layout('SKI', 2)[1]
+    avax_w = bitmap_font.layout('AVAX', 3)[1]
+    bitmap_font.draw_text(b, 128, 86 - ski_w // 2, 5, 'SKI', GLD, 2)
+    bitmap_font.draw_text(b, 128, 86 - avax_w // 2, 22, 'AVAX', W, 3)
     save(b, 128, 48, os.path.join(out, 'skiavax_logo.png'))
 
+# ── Fonts ─────────────────────────────────────────────────────────────────────
+def gen_fonts():
+    """Pixel font atlas + metrics/kerning JSON for js/BitmapFont.js.
+
+    Glyphs are white so the JS can tint them; no LOD variant, since the
+    metrics describe full-size glyph rects.
+    """
+    out = os.path.join(BASE, 'assets', 'fonts')
+    w, h, b, metrics = bitmap_font.build_atlas()
+    save(b, w, h, os.path.join(out, 'pixel.png'))
+    with open(os.path.join(out, 'pixel.json'), 'w', encoding='utf-8') as f:
+        json.dump(metrics, f, indent=2, ensure_ascii=False)
+        f.write('\n')
+    print('  ✓ assets/fonts/pixel.json')
+
+# ── Baked gradients ──────────────────────────────────────────────────────────
+# The menu / game-over / leaderboard backgrounds and the blackhole glow used to
+# be rebuilt with createLinearGradient / createRadialGradient on every frame.
+# They're baked here from the same colour stops (ordered-dithered to hide
+# banding) so the JS just blits a cached texture.
+CANVAS_H = 600   # CANVAS_HEIGHT in js/utils/constants.js
+BG_TILE  = 8     # one Bayer period; JS fills the canvas with it as a repeat-x pattern
+
+def hex_rgba(s, a=1.0):
+    """'#1a1a3e' → (26, 26, 62, 255 * a) as floats."""
+    return (int(s[1:3], 16), int(s[3:5], 16), int(s[5:7], 16), 255 * a)
+
+def bayer8(x, y):
+    """8×8 ordered-dither threshold in (0, 1) for pixel (x, y)."""
+    v = 0
+    for i in range(3):
+        xb, yb = x >> i & 1, y >> i & 1
+        v |= ((xb ^ yb) << 1 | yb) << (4 - 2 * i)
+    return (v + 0.5) / 64
+
+def gradient_at(stops, t):
+    """Colour at t along [(offset, rgba), ...], clamped like canvas gradients."""
+    if t <= stops[0][0]:
+        return stops[0][1]
+    for (o0, c0), (o1, c1) in zip(stops, stops[1:]):
+        if t <= o1:
+            f = (t - o0) / (o1 - o0)
+            return tuple(a + (b - a) * f for a, b in zip(c0, c1))
+    return stops[-1][1]
+
+def dithered(c, x, y):
+    d = bayer8(x, y)
+    return tuple(min(255, int(v + d)) for v in c)
+
+def linear_bg(stops):
+    """BG_TILE×CANVAS_H tile of a top-to-bottom linear gradient."""
+    b = cv(BG_TILE, CANVAS_H)
+    for y in range(CANVAS_H):
+        c = gradient_at(stops, (y + 0.5) / CANVAS_H)
+        for x in range(BG_TILE):
+            b[y * BG_TILE + x] = dithered(c, x, y)
+    return b
+
+def radial_glow(stops, size, inner):
+    """size×size glow: radial gradient from inner×radius out to the texture edge."""
+    b = cv(size, size)
+    R = size / 2
+    for y in range(size):
+        for x in range(size):
+            d = math.hypot(x + 0.5 - R, y + 0.5 - R)
+            if d > R:
+                continue
+            c = dithered(gradient_at(stops, (d / R - inner) / (1 - inner)), x, y)
+            if c[3]:
+                b[y * size + x] = c
+    return b
+
+def gen_backgrounds():
+    out = os.path.join(SPRITES, 'ui')
+    # MenuState: #1a1a3e → #2a2a5e → #0d0d2b
+    save(linear_bg([(0, hex_rgba('#1a1a3e')), (0.5, hex_rgba('#2a2a5e')), (1, hex_rgba('#0d0d2b'))]),
+         BG_TILE, CANVAS_H, os.path.join(out, 'bg_menu.png'))
+    # GameOverState: #0d0d2b → #1a1a3e
+    save(linear_bg([(0, hex_rgba('#0d0d2b')), (1, hex_rgba('#1a1a3e'))]),
+         BG_TILE, CANVAS_H, os.path.join(out, 'bg_gameover.png'))
+    # LeaderboardState: #1a1a3e → #0d0d2b
+    save(linear_bg([(0, hex_rgba('#1a1a3e')), (1, hex_rgba('#0d0d2b'))]),
+         BG_TILE, CANVAS_H, os.path.join(out, 'bg_leaderboard.png'))
+
+    # Blackhole glow (64×64): Obstacle.js gradient from 0.3r to 1.2r, so the
+    # texture edge is 1.2r and the inner stop sits at 0.25 of its radius
+    out = os.path.join(SPRITES, 'fx')
+    save(radial_glow([(0, (100, 0, 200, 255 * 0.6)), (0.5, (50, 0, 100, 255 * 0.3)), (1, (0, 0, 0, 0))],
+                     64, 0.3 / 1.2),
+         64, 64, os.path.join(out, 'blackhole_glow.png'))
+
+# ── Watch mode ────────────────────────────────────────────────────────────────
+GENERATORS = [
+    ('Player',       'gen_players'),
+    ('Obstacles',    'gen_obstacles'),
+    ('Collectibles', 'gen_collectibles'),
+    ('NPCs',         'gen_npcs'),
+    ('Boss',         'gen_boss'),
+    ('UI',           'gen_ui'),
+    ('Backgrounds',  'gen_backgrounds'),
+    ('Fonts',        'gen_fonts'),
+]
+
+def build(ns, names, owners):
+    """Run the named generators from namespace ns, recording which files each writes."""
+    failed = set()
+    first = len(ns['_SAVED'])
+    for label, fn in GENERATORS:
+        if fn not in names:
+            continue
+        print(f'\n{label}:')
+        start = len(ns['_SAVED'])
+        try:
+            ns[fn]()
+        except Exception:
+            traceback.print_exc()
+            failed.add(fn)
+        for path in ns['_SAVED'][start:]:
+            owners[path] = fn
+    if len(ns['_SAVED']) > first:
+        print('\nLODs:')
+        ns['write_lods']()
+    return failed
+
+def top_level(src):
+    """Map each top-level def/assignment to (source text, names it references).
+
+    Everything else at module level (imports, the main block) is folded into a
+    single '<module>' entry so that edits there force a full rebuild.
+    """
+    tree = ast.parse(src)
+    lines = src.splitlines()
+    out, rest = {}, []
+    for node in tree.body:
+        seg = '\n'.join(lines[node.lineno - 1:node.end_lineno])
+        if isinstance(node, ast.FunctionDef):
+            names = [node.name]
+        elif isinstance(node, ast.Assign):
+            names = [t.id for t in node.targets if isinstance(t, ast.Name)]
+        else:
+            names = []
+        if not names:
+            if not (isinstance(node, ast.If) and 'main' in ast.dump(node.test)):
+                rest.append(seg)
+            continue
+        refs = {n.id for n in ast.walk(node) if isinstance(n, ast.Name)}
+        for name in names:
+            out[name] = (seg, refs)
+    out['<module>'] = ('\n'.join(rest), set())
+    return out
+
+def dirty_names(old, new):
+    """Names whose source changed, plus everything that transitively uses them."""
+    dirty = {n for n in old.keys() | new.keys() if old.get(n, (None,))[0] != new.get(n, (None,))[0]}
+    if '<module>' in dirty:
+        return set(new)
+    return users_of(new, dirty)
+
+def users_of(tree, names):
+    """names plus every top-level name in tree that transitively references one of them."""
+    dirty = set(names)
+    grew = True
+    while grew:
+        grew = False
+        for name, (_, refs) in tree.items():
+            if name not in dirty and refs & dirty:
+                dirty.add(name)
+                grew = True
+    return dirty
+
+def load(src, cache):
+    """Execute generator source in a fresh namespace that reuses cache for base buffers."""
+    ns = {'__name__': '__sprites__', '__file__': os.path.abspath(__file__)}
+    exec(compile(src, ns['__file__'], 'exec'), ns)
+    ns['_BASE_CACHE'] = cache
+    return ns
+
+def read_manifest():
+    try:
+        with open(MANIFEST) as f:
+            return {k: v for k, v in json.load(f).items() if not k.startswith('_')}
+    except (OSError, ValueError) as e:
+        print(f'  ! manifest.json unreadable: {e}')
+        return None
+
+def mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+def generator_names(ns):
+    """Generator function names listed in ns's GENERATORS (the reloaded source's, in watch mode)."""
+    return {fn for _, fn in ns['GENERATORS']}
+
+def watch(interval):
+    """Poll this script, bitmap_font.py and manifest.json, rebuilding only the sprites an edit touches."""
+    src_path = os.path.abspath(__file__)
+    font_path = os.path.abspath(bitmap_font.__file__)
+    with open(src_path) as f:
+        src = f.read()
+    tree = top_level(src)
+    cache, owners = {}, {}
+    ns = load(src, cache)
+    failed = ns['build'](ns, generator_names(ns), owners)
+    manifest = read_manifest() or {}
+    stamps = (mtime(src_path), mtime(MANIFEST), mtime(font_path))
+    print(f'\nWatching {os.path.relpath(src_path, BASE)}, {os.path.relpath(font_path, BASE)} '
+          f'and assets/manifest.json (Ctrl-C to stop)...')
+
+    while True:
+        time.sleep(interval)
+        now = (mtime(src_path), mtime(MANIFEST), mtime(font_path))
+        if now == stamps:
+            continue
+        t0 = time.perf_counter()
+        todo = set(failed)
+
+        if now[0] != stamps[0]:
+            with open(src_path) as f:
+                new_src = f.read()
+            try:
+                new_tree = top_level(new_src)
+                dirty = dirty_names(tree, new_tree)
+                for key in [k for k in cache if k[0] in dirty]:
+                    del cache[key]
+                ns = load(new_src, cache)
+            except Exception:
+                traceback.print_exc()
+                stamps = now
+                continue
+            tree = new_tree
+            todo |= generator_names(ns) & dirty
+
+        if now[2] != stamps[2]:
+            # Glyph shapes/kerning changed: reload the module in place (the
+            # generator namespace holds the same module object) and redo
+            # everything that draws text.
+            try:
+                importlib.reload(bitmap_font)
+            except Exception:
+                traceback.print_exc()
+                stamps = now
+                continue
+            dirty = users_of(tree, {'bitmap_font'})
+            for key in [k for k in cache if k[0] in dirty]:
+                del cache[key]
+            todo |= generator_names(ns) & dirty
+
+        if now[1] != stamps[1]:
+            new_manifest = read_manifest()
+            if new_manifest is not None:
+                for key, path in new_manifest.items():
+                    if manifest.get(key) == path:
+                        continue
+                    owner = owners.get(os.path.join(BASE, path))
+                    if owner:
+                        todo.add(owner)
+                    else:
+                        print(f'  ! {key}: no generator writes {path}')
+                if new_manifest != manifest and not todo:
+                    # e.g. a key pointed at a hand-authored PNG: only its LOD changes
+                    print('\nLODs:')
+                    ns['write_lods']()
+                    now = (now[0], mtime(MANIFEST), now[2])
+                manifest = new_manifest
+
+        stamps = now
+        todo &= generator_names(ns)   # generators renamed or removed since they failed
+        if not todo:
+            print('\n(no sprites affected)')
+            continue
+        failed = ns['build'](ns, todo, owners)
+        # build() rewrites the manifest's "_lod" section; don't treat that as an edit
+        stamps = (stamps[0], mtime(MANIFEST), stamps[2])
+        manifest = read_manifest() or manifest
+        ms = (time.perf_counter() - t0) * 1000
+        print(f'\nRebuilt {", ".join(sorted(todo))} in {ms:.0f} ms')
+
 # ── Main ──────────────────────────────────────────────────────────────────────
 if __name__ == '__main__':
+    ap = argparse.ArgumentParser(description='Generate SkiAvax sprites.')
+    ap.add_argument('--watch', action='store_true',
+                    help='keep running and rebuild only the sprites affected by each edit')
+    ap.add_argument('--interval', type=float, default=0.1,
+                    help='watch polling interval in seconds (default: 0.1)')
+    ap.add_argument('--lods-only', action='store_true',
+                    help='only rebuild lod/ copies of the PNGs in manifest.json (no generators)')
+    args = ap.parse_args()
+
+    if args.lods_only:
+        print('SkiAvax — Building LODs...')
+        write_lods()
+        sys.exit(0)
+
     print('SkiAvax — Generating sprites...')
-    print('\nPlayer:')
-    gen_players()
-    print('\nObstacles:')
-    gen_obstacles()
-    print('\nCollectibles:')
-    gen_collectibles()
-    print('\nNPCs:')
-    gen_npcs()
-    print('\nBoss:')
-    gen_boss()
-    print('\nUI:')
-    gen_ui()
+    if args.watch:
+        try:
+            watch(args.interval)
+        except KeyboardInterrupt:
+            print('\nStopped.')
+        sys.exit(0)
+    if build(globals(), {fn for _, fn in GENERATORS}, {}):
+        sys.exit(1)
     print(f'\nDone! All sprites written to assets/sprites/')
@@ -8,12 +8,27 @@ export class AssetManager {
         this.loadProgress = 0;
     }
 
+    /**
+     * Pick the manifest device class for this browser.
+     * "low" selects the half-size LOD sprites (¼ the decoded texture memory).
+     * Override with ?lod=low or ?lod=default in the page URL.
+     * @returns {string}
+     */
+    static detectDeviceClass() {
+        const forced = new URLSearchParams(window.location.search).get('lod');
+        if (forced) return forced;
+        // navigator.deviceMemory is in GB (Chromium only; undefined elsewhere)
+        if (navigator.deviceMemory !== undefined && navigator.deviceMemory <= 2) return 'low';
+        return 'default';
+    }
+
     /**
      * Load manifest and all assets
      * @param {string} manifestPath - path to manifest.json
+     * @param {string} deviceClass - key into the manifest's "_lod" section
      * @returns {Promise} resolves when all assets are loaded
      */
-    async loadManifest(manifestPath) {
+    async loadManifest(manifestPath, deviceClass = AssetManager.detectDeviceClass()) {
         try {
             const response = await fetch(manifestPath);
             this.manifest = await response.json();
@@ -31,6 +46,9 @@ export class AssetManager {
             return;
         }
 
+        // Per-device-class overrides (e.g. half-size LOD sprites for "low")
+        const lod = (this.manifest._lod && this.manifest._lod[deviceClass]) || {};
+
         let loadedCount = 0;
         const totalCount = entries.length;
 
@@ -44,18 +62,23 @@ export class AssetManager {
                     resolve();
                 };
                 img.onerror = () => {
+                    // LOD variant missing — fall back to the full-size sprite
+                    if (lod[key] && img.src.endsWith(lod[key])) {
+                        img.src = path;
+                        return;
+                    }
                     console.warn(`AssetManager: Failed to load "${key}" from "${path}"`);
                     loadedCount++;
                     this.loadProgress = loadedCount / totalCount;
                     resolve(); // Don't reject — just skip missing assets
                 };
-                img.src = path;
+                img.src = lod[key] || path;
             });
         });
 
         await Promise.all(promises);
         this.loaded = true;
-        console.log(`AssetManager: Loaded ${Object.keys(this.images).length}/${totalCount} assets.`);
+        console.log(`AssetManager: Loaded ${Object.keys(this.images).length}/${totalCount} assets (${deviceClass}).`);
     }
 
     /**
@@ -0,0 +1,101 @@
+// SkiAvax — Bitmap Font (pixel glyph atlas from generate_sprites.py)
+
+export class BitmapFont {
+    /**
+     * @param {HTMLImageElement} image - White glyph atlas
+     * @param {object} metrics - Glyph rects, advances and kerning (pixel.json)
+     */
+    constructor(image, metrics) {
+        this.image = image;
+        this.glyphs = metrics.glyphs;
+        this.kerning = metrics.kerning || {};
+        this.height = metrics.height;
+        this.spacing = metrics.spacing;
+        this._tinted = new Map(); // color → atlas canvas tinted once
+    }
+
+    /**
+     * Load the atlas registered under a manifest key; metrics sit next to it
+     * as a .json file. Resolves to null if either is missing.
+     * @param {AssetManager} assets
+     * @param {string} key - manifest key of the atlas image
+     * @returns {Promise<BitmapFont|null>}
+     */
+    static async load(assets, key) {
+        const image = assets.get(key);
+        const path = assets.manifest[key];
+        if (!image || !path) return null;
+        try {
+            const res = await fetch(path.replace(/\.png$/, '.json'));
+            return new BitmapFont(image, await res.json());
+        } catch (err) {
+            console.warn(`BitmapFont: Could not load metrics for "${key}"`, err);
+            return null;
+        }
+    }
+
+    _glyph(ch) {
+        if (/\s/.test(ch)) return this.glyphs[' ']; // incl. locale group separators
+        return this.glyphs[ch] || this.glyphs[ch.toUpperCase()] || this.glyphs['?'];
+    }
+
+    /**
+     * Width of a single line of text in canvas pixels
+     */
+    measure(text, scale = 1) {
+        let pen = 0;
+        for (let i = 0; i < text.length; i++) {
+            pen += this._glyph(text[i]).advance + (this.kerning[text.substr(i, 2)] || 0);
+        }
+        return Math.max(0, pen - this.spacing) * scale;
+    }
+
+    /**
+     * Draw text as glyph blits from a per-color cached atlas
+     * @param {CanvasRenderingContext2D} ctx
+     * @param {string} text
+     * @param {number} x - anchor X (see align)
+     * @param {number} y - vertical center
+     * @param {object} opts - { color, align: 'left'|'center'|'right', scale }
+     */
+    draw(ctx, text, x, y, { color = '#FFFFFF', align = 'left', scale = 1 } = {}) {
+        const atlas = this._atlas(color);
+        let pen = x;
+        if (align !== 'left') {
+            const w = this.measure(text, scale);
+            pen -= align === 'center' ? w / 2 : w;
+        }
+        const top = Math.round(y - (this.height * scale) / 2);
+        pen = Math.round(pen);
+
+        const smoothing = ctx.imageSmoothingEnabled;
+        ctx.imageSmoothingEnabled = false;
+        for (let i = 0; i < text.length; i++) {
+            const g = this._glyph(text[i]);
+            if (g.w > 0) {
+                ctx.drawImage(atlas, g.x, g.y, g.w, g.h, pen, top, g.w * scale, g.h * scale);
+            }
+            pen += (g.advance + (this.kerning[text.substr(i, 2)] || 0)) * scale;
+        }
+        ctx.imageSmoothingEnabled = smoothing;
+    }
+
+    /**
+     * Atlas tinted to a color (built on first use, then reused every frame)
+     */
+    _atlas(color) {
+        let canvas = this._tinted.get(color);
+        if (!canvas) {
+            canvas = document.createElement('canvas');
+            canvas.width = this.image.width;
+            canvas.height = this.image.height;
+            const c = canvas.getContext('2d');
+            c.drawImage(this.image, 0, 0);
+            c.globalCompositeOperation = 'source-in';
+            c.fillStyle = color;
+            c.fillRect(0, 0, canvas.width, canvas.height);
+            this._tinted.set(color, canvas);
+        }
+        return canvas;
+    }
+}
@@ -3,6 +3,7 @@
 import { Camera } from './Camera.js';
 import { InputManager } from './InputManager.js';
 import { AssetManager } from './AssetManager.js';
+import { BitmapFont } from './BitmapFont.js';
 import { LeaderboardManager } from './LeaderboardManager.js';
 import { MenuState } from './states/MenuState.js';
 import { PlayState } from './states/PlayState.js';
@@ -18,6 +19,7 @@ export class Game {
         this.camera = new Camera();
         this.input = new InputManager();
         this.assets = new AssetManager();
+        this.font = null; // BitmapFont for HUD text, once assets are loaded
         this.leaderboard = new LeaderboardManager();
 
         // Set canvas size
@@ -61,6 +63,7 @@ export class Game {
     async start() {
         // Load assets (gracefully — game works with placeholders if assets are missing)
         await this.assets.loadManifest('assets/manifest.json');
+        this.font = await BitmapFont.load(this.assets, 'font_pixel');
 
         this.running = true;
         this.states[this.currentState].enter();
@@ -2,9 +2,26 @@
 
 import { SUPABASE_URL, SUPABASE_ANON_KEY } from './config.js';
 
+/**
+ * Leaderboard base URL: Supabase, or a local stand-in (leaderboard_server.py)
+ * when the page is opened with ?leaderboard=http://localhost:54321
+ */
+function resolveBaseUrl() {
+    const override = new URLSearchParams(window.location.search).get('leaderboard');
+    if (override) {
+        try {
+            const { hostname } = new URL(override);
+            if (hostname === 'localhost' || hostname === '127.0.0.1') return override.replace(/\/$/, '');
+        } catch { /* ignore malformed override */ }
+        console.warn('LeaderboardManager: ignoring non-local ?leaderboard= override');
+    }
+    return SUPABASE_URL;
+}
+
 export class LeaderboardManager {
     constructor() {
-        this.configured = !!(SUPABASE_URL && SUPABASE_ANON_KEY);
+        this.baseUrl = resolveBaseUrl();
+        this.configured = !!(this.baseUrl && SUPABASE_ANON_KEY);
         this._headers = this.configured ? {
             'Content-Type': 'application/json',
             'apikey': SUPABASE_ANON_KEY,
@@ -22,7 +39,7 @@ export class LeaderboardManager {
     async submitScore({ name, score, distance, mode, tokens = 0, combo = 1 }) {
         if (!this.configured) return { success: false };
         try {
-            const res = await fetch(`${SUPABASE_URL}/rest/v1/scores`, {
+            const res = await fetch(`${this.baseUrl}/rest/v1/scores`, {
                 method: 'POST',
                 headers: { ...this._headers, 'Prefer': 'return=minimal' },
                 body: JSON.stringify({
@@ -47,7 +64,7 @@ export class LeaderboardManager {
         if (!this.configured) return { success: false, scores: [] };
         try {
             const order = mode === 'slalom' ? 'score.asc' : 'score.desc';
-            const url = `${SUPABASE_URL}/rest/v1/scores` +
+            const url = `${this.baseUrl}/rest/v1/scores` +
                 `?select=player_name,score,distance,tokens_collected,best_combo,created_at` +
                 `&mode=eq.${mode}&order=${order}&limit=${limit}`;
             const res = await fetch(url, { headers: this._headers });
@@ -66,10 +83,12 @@ export class LeaderboardManager {
     async getRank(score, mode) {
         if (!this.configured) return null;
         try {
-            // Count how many players have a strictly better score
+            // Count how many players have a strictly better score.
+            // HEAD returns only the Content-Range count, not the matching rows.
             const op = mode === 'slalom' ? `lt.${score}` : `gt.${score}`;
-            const url = `${SUPABASE_URL}/rest/v1/scores?select=id&mode=eq.${mode}&score=${op}`;
+            const url = `${this.baseUrl}/rest/v1/scores?select=id&mode=eq.${mode}&score=${op}`;
             const res = await fetch(url, {
+                method: 'HEAD',
                 headers: { ...this._headers, 'Prefer': 'count=exact' },
             });
             if (!res.ok) return null;
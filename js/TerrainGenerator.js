@@ -132,6 +132,7 @@ export class TerrainGenerator {
                 if (this.assets) {
                     const spriteKey = `obstacle_${type}`;
                     obstacle.sprite = this.assets.get(spriteKey);
+                    obstacle.glowSprite = this.assets.get('fx_blackhole_glow');
                 }
 
                 this.recentPositions.push({ x, y });
@@ -3,6 +3,9 @@
 // 1. Create a free project at https://supabase.com
 // 2. Run the SQL in supabase_setup.sql in your project's SQL editor
 // 3. Go to Project Settings → API and copy your URL + anon/public key below
+//
+// Offline development: run `python3 leaderboard_server.py` and open the game
+// with ?leaderboard=http://localhost:54321 to use the local stand-in instead.
 // ─────────────────────────────────────────────────────────────────────────────
 
 export const SUPABASE_URL = 'https://tgnvlrbgaoqrybdpofhl.supabase.co';       // e.g. 'https://abcdefgh.supabase.co'
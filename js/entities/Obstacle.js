@@ -8,6 +8,7 @@ export class Obstacle extends Entity {
         super(x, y, width, height);
         this.type = 'obstacle';
         this.obstacleType = OBSTACLE_TYPES.AVAX_TREE;
+        this.glowSprite = null;
     }
 
     init(x, y, width, height, obstacleType) {
@@ -69,15 +70,19 @@ export class Obstacle extends Entity {
     _renderBlackhole(ctx, x, y) {
         const r = this.width / 2;
 
-        // Outer glow
-        const glow = ctx.createRadialGradient(x, y, r * 0.3, x, y, r * 1.2);
-        glow.addColorStop(0, 'rgba(100, 0, 200, 0.6)');
-        glow.addColorStop(0.5, 'rgba(50, 0, 100, 0.3)');
-        glow.addColorStop(1, 'rgba(0, 0, 0, 0)');
-        ctx.fillStyle = glow;
-        ctx.beginPath();
-        ctx.arc(x, y, r * 1.2, 0, Math.PI * 2);
-        ctx.fill();
+        // Outer glow (baked texture, falls back to a per-draw gradient)
+        if (this.glowSprite) {
+            ctx.drawImage(this.glowSprite, x - r * 1.2, y - r * 1.2, r * 2.4, r * 2.4);
+        } else {
+            const glow = ctx.createRadialGradient(x, y, r * 0.3, x, y, r * 1.2);
+            glow.addColorStop(0, 'rgba(100, 0, 200, 0.6)');
+            glow.addColorStop(0.5, 'rgba(50, 0, 100, 0.3)');
+            glow.addColorStop(1, 'rgba(0, 0, 0, 0)');
+            ctx.fillStyle = glow;
+            ctx.beginPath();
+            ctx.arc(x, y, r * 1.2, 0, Math.PI * 2);
+            ctx.fill();
+        }
 
         // Dark center
         ctx.fillStyle = '#0a0015';
@@ -1,7 +1,7 @@
 // SkiAvax — Game Over State
 
 import { CANVAS_WIDTH, CANVAS_HEIGHT, COLORS } from '../utils/constants.js';
-import { formatScore, formatTime } from '../utils/helpers.js';
+import { formatScore, formatTime, drawBackground } from '../utils/helpers.js';
 
 const NAME_MAX = 16;
 const NAME_STORAGE_KEY = 'skiavax_player_name';
@@ -83,21 +83,35 @@ export class GameOverState {
     }
 
     render(ctx) {
-        // Background
-        const grad = ctx.createLinearGradient(0, 0, 0, CANVAS_HEIGHT);
-        grad.addColorStop(0, '#0d0d2b');
-        grad.addColorStop(1, '#1a1a3e');
-        ctx.fillStyle = grad;
-        ctx.fillRect(0, 0, CANVAS_WIDTH, CANVAS_HEIGHT);
+        // Background (baked texture, built once if it's missing)
+        const bg = this.game.assets.get('bg_gameover');
+        if (bg) {
+            drawBackground(ctx, bg);
+        } else {
+            if (!this._bgGrad) {
+                this._bgGrad = ctx.createLinearGradient(0, 0, 0, CANVAS_HEIGHT);
+                this._bgGrad.addColorStop(0, '#0d0d2b');
+                this._bgGrad.addColorStop(1, '#1a1a3e');
+            }
+            ctx.fillStyle = this._bgGrad;
+            ctx.fillRect(0, 0, CANVAS_WIDTH, CANVAS_HEIGHT);
+        }
 
         ctx.textAlign = 'center';
         ctx.textBaseline = 'middle';
 
-        // Title
+        // Title (bitmap font blits when available)
         const titleY = 75;
-        ctx.font = 'bold 40px "Segoe UI", Arial, sans-serif';
-        ctx.fillStyle = this.mode === 'freerun' ? COLORS.AVAX_RED : COLORS.PHARAOH_GOLD;
-        ctx.fillText(this.mode === 'freerun' ? 'GAME OVER' : 'RACE COMPLETE', CANVAS_WIDTH / 2, titleY);
+        const title = this.mode === 'freerun' ? 'GAME OVER' : 'RACE COMPLETE';
+        const titleColor = this.mode === 'freerun' ? COLORS.AVAX_RED : COLORS.PHARAOH_GOLD;
+        if (this.game.font) {
+            this.game.font.draw(ctx, title, CANVAS_WIDTH / 2, titleY,
+                { color: titleColor, align: 'center', scale: 4 });
+        } else {
+            ctx.font = 'bold 40px "Segoe UI", Arial, sans-serif';
+            ctx.fillStyle = titleColor;
+            ctx.fillText(title, CANVAS_WIDTH / 2, titleY);
+        }
 
         // New high score flash
         if (this.isNewHighScore) {
@@ -1,7 +1,7 @@
 // SkiAvax — Leaderboard State
 
 import { CANVAS_WIDTH, CANVAS_HEIGHT, COLORS } from '../utils/constants.js';
-import { formatScore, formatTime } from '../utils/helpers.js';
+import { formatScore, formatTime, drawBackground } from '../utils/helpers.js';
 
 const TABS = ['Free Run', 'Slalom'];
 const ROW_H = 36;
@@ -69,12 +69,19 @@ export class LeaderboardState {
     }
 
     render(ctx) {
-        // Background
-        const grad = ctx.createLinearGradient(0, 0, 0, CANVAS_HEIGHT);
-        grad.addColorStop(0, '#1a1a3e');
-        grad.addColorStop(1, '#0d0d2b');
-        ctx.fillStyle = grad;
-        ctx.fillRect(0, 0, CANVAS_WIDTH, CANVAS_HEIGHT);
+        // Background (baked texture, built once if it's missing)
+        const bg = this.game.assets.get('bg_leaderboard');
+        if (bg) {
+            drawBackground(ctx, bg);
+        } else {
+            if (!this._bgGrad) {
+                this._bgGrad = ctx.createLinearGradient(0, 0, 0, CANVAS_HEIGHT);
+                this._bgGrad.addColorStop(0, '#1a1a3e');
+                this._bgGrad.addColorStop(1, '#0d0d2b');
+            }
+            ctx.fillStyle = this._bgGrad;
+            ctx.fillRect(0, 0, CANVAS_WIDTH, CANVAS_HEIGHT);
+        }
 
         // Snowflakes
         ctx.fillStyle = 'rgba(255,255,255,0.4)';
@@ -87,10 +94,16 @@ export class LeaderboardState {
         ctx.textAlign = 'center';
         ctx.textBaseline = 'middle';
 
-        // Title
-        ctx.font = 'bold 36px "Segoe UI", Arial, sans-serif';
-        ctx.fillStyle = COLORS.PHARAOH_GOLD;
-        ctx.fillText('🏆  GLOBAL LEADERBOARD', CANVAS_WIDTH / 2, 80);
+        // Title (bitmap font blits when available)
+        const font = this.game.font;
+        if (font) {
+            font.draw(ctx, 'GLOBAL LEADERBOARD', CANVAS_WIDTH / 2, 80,
+                { color: COLORS.PHARAOH_GOLD, align: 'center', scale: 4 });
+        } else {
+            ctx.font = 'bold 36px "Segoe UI", Arial, sans-serif';
+            ctx.fillStyle = COLORS.PHARAOH_GOLD;
+            ctx.fillText('🏆  GLOBAL LEADERBOARD', CANVAS_WIDTH / 2, 80);
+        }
 
         ctx.font = '13px "Segoe UI", Arial, sans-serif';
         ctx.fillStyle = 'rgba(255,255,255,0.4)';
@@ -114,9 +127,14 @@ export class LeaderboardState {
                 ctx.stroke();
             }
 
-            ctx.font = isActive ? 'bold 14px "Segoe UI", Arial, sans-serif' : '14px "Segoe UI", Arial, sans-serif';
-            ctx.fillStyle = isActive ? COLORS.AVAX_WHITE : 'rgba(255,255,255,0.5)';
-            ctx.fillText(TABS[i], tx + 60, 173);
+            const tabColor = isActive ? COLORS.AVAX_WHITE : 'rgba(255,255,255,0.5)';
+            if (font) {
+                font.draw(ctx, TABS[i], tx + 60, 173, { color: tabColor, align: 'center', scale: 2 });
+            } else {
+                ctx.font = isActive ? 'bold 14px "Segoe UI", Arial, sans-serif' : '14px "Segoe UI", Arial, sans-serif';
+                ctx.fillStyle = tabColor;
+                ctx.fillText(TABS[i], tx + 60, 173);
+            }
         }
 
         // Hint
@@ -1,6 +1,7 @@
 // SkiAvax — Menu State
 
 import { CANVAS_WIDTH, CANVAS_HEIGHT, COLORS } from '../utils/constants.js';
+import { drawBackground } from '../utils/helpers.js';
 
 export class MenuState {
     constructor(game) {
@@ -95,13 +96,20 @@ export class MenuState {
     }
 
     render(ctx) {
-        // Background gradient
-        const grad = ctx.createLinearGradient(0, 0, 0, CANVAS_HEIGHT);
-        grad.addColorStop(0, '#1a1a3e');
-        grad.addColorStop(0.5, '#2a2a5e');
-        grad.addColorStop(1, '#0d0d2b');
-        ctx.fillStyle = grad;
-        ctx.fillRect(0, 0, CANVAS_WIDTH, CANVAS_HEIGHT);
+        // Background gradient (baked texture, built once if it's missing)
+        const bg = this.game.assets.get('bg_menu');
+        if (bg) {
+            drawBackground(ctx, bg);
+        } else {
+            if (!this._bgGrad) {
+                this._bgGrad = ctx.createLinearGradient(0, 0, 0, CANVAS_HEIGHT);
+                this._bgGrad.addColorStop(0, '#1a1a3e');
+                this._bgGrad.addColorStop(0.5, '#2a2a5e');
+                this._bgGrad.addColorStop(1, '#0d0d2b');
+            }
+            ctx.fillStyle = this._bgGrad;
+            ctx.fillRect(0, 0, CANVAS_WIDTH, CANVAS_HEIGHT);
+        }
 
         // Snowflakes
         ctx.fillStyle = 'rgba(255,255,255,0.5)';
@@ -477,11 +477,17 @@ export class PlayState {
             ctx.lineTo(avaxIconX + avaxIconR * 0.55, y + avaxIconR * 0.5);
             ctx.closePath();
             ctx.fill();
-            // Score text
-            ctx.textAlign = 'left';
-            ctx.fillStyle = COLORS.PHARAOH_GOLD;
-            ctx.font = 'bold 16px "Segoe UI", monospace';
-            ctx.fillText(`${formatScore(this.score.totalScore)}`, avaxIconX + avaxIconR + 6, y);
+            // Score text (bitmap font blits when available)
+            const scoreText = formatScore(this.score.totalScore);
+            if (this.game.font) {
+                this.game.font.draw(ctx, scoreText, avaxIconX + avaxIconR + 6, y,
+                    { color: COLORS.PHARAOH_GOLD, scale: 2 });
+            } else {
+                ctx.textAlign = 'left';
+                ctx.fillStyle = COLORS.PHARAOH_GOLD;
+                ctx.font = 'bold 16px "Segoe UI", monospace';
+                ctx.fillText(scoreText, avaxIconX + avaxIconR + 6, y);
+            }
         } else {
             ctx.textAlign = 'center';
             ctx.fillStyle = COLORS.PHARAOH_GOLD;
@@ -496,11 +502,17 @@ export class PlayState {
 
         // Combo
         if (this.score.combo > 1 && this.mode === 'freerun') {
-            ctx.textAlign = 'right';
             const comboColor = COLORS.COMBO_COLORS[Math.min(this.score.combo - 1, COLORS.COMBO_COLORS.length - 1)];
-            ctx.fillStyle = comboColor;
-            ctx.font = 'bold 14px "Segoe UI", monospace';
-            ctx.fillText(`COMBO x${this.score.combo}`, CANVAS_WIDTH - padding - 80, y);
+            const comboText = `COMBO x${this.score.combo}`;
+            if (this.game.font) {
+                this.game.font.draw(ctx, comboText, CANVAS_WIDTH - padding - 80, y,
+                    { color: comboColor, align: 'right', scale: 2 });
+            } else {
+                ctx.textAlign = 'right';
+                ctx.fillStyle = comboColor;
+                ctx.font = 'bold 14px "Segoe UI", monospace';
+                ctx.fillText(comboText, CANVAS_WIDTH - padding - 80, y);
+            }
         }
 
         // Speed indicator
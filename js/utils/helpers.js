@@ -1,5 +1,7 @@
 // SkiAvax — Utility Helpers
 
+import { CANVAS_WIDTH, CANVAS_HEIGHT } from './constants.js';
+
 /**
  * Random number between min and max (inclusive)
  */
@@ -112,3 +114,19 @@ export function easeOutCubic(t) {
 export function easeInOutQuad(t) {
     return t < 0.5 ? 2 * t * t : 1 - Math.pow(-2 * t + 2, 2) / 2;
 }
+
+const bgPatterns = new WeakMap(); // tile image → repeat-x pattern, built once
+
+/**
+ * Fill the canvas with a baked background tile (bg_* in the manifest),
+ * repeated horizontally as a single pattern fill
+ */
+export function drawBackground(ctx, img) {
+    let pattern = bgPatterns.get(img);
+    if (!pattern) {
+        pattern = ctx.createPattern(img, 'repeat-x');
+        bgPatterns.set(img, pattern);
+    }
+    ctx.fillStyle = pattern;
+    ctx.fillRect(0, 0, CANVAS_WIDTH, CANVAS_HEIGHT);
+}
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+SkiAvax Leaderboard Load Generator
+Replays the requests js/LeaderboardManager.js makes (submit score, top-10
+page, rank lookup) against a leaderboard endpoint from concurrent workers and
+reports throughput and latency percentiles per operation.
+
+    python3 leaderboard_server.py --quiet &
+    python3 leaderboard_loadgen.py --seed 50000 --workers 16 --duration 10
+
+Point --url at a real Supabase project (with --key) to compare.
+"""
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+from urllib.error import HTTPError, URLError
+from urllib.request import Request, urlopen
+
+MODES = ('freerun', 'slalom')
+NAMES = ('pharaoh', 'benqi', 'salvor', 'blaze', 'arena', 'yak', 'dokyo', 'dexalot', 'pango', 'joe')
+
+
+class Client:
+    """The three LeaderboardManager calls, over plain urllib."""
+
+    def __init__(self, url, key):
+        self.base = url.rstrip('/') + '/rest/v1/scores'
+        self.headers = {'Content-Type': 'application/json', 'apikey': key,
+                        'Authorization': f'Bearer {key}'}
+
+    def _call(self, method, url, body=None, extra=None):
+        req = Request(url, data=body, method=method, headers={**self.headers, **(extra or {})})
+        with urlopen(req, timeout=10) as res:
+            res.read()
+            return res
+
+    def submit(self, rows):
+        body = json.dumps(rows).encode()
+        self._call('POST', self.base, body, {'Prefer': 'return=minimal'})
+
+    def top(self, mode, limit=10):
+        order = 'score.asc' if mode == 'slalom' else 'score.desc'
+        self._call('GET', f'{self.base}?select=player_name,score,distance,tokens_collected,'
+                          f'best_combo,created_at&mode=eq.{mode}&order={order}&limit={limit}')
+
+    def rank(self, score, mode):
+        op = f'lt.{score}' if mode == 'slalom' else f'gt.{score}'
+        res = self._call('HEAD', f'{self.base}?select=id&mode=eq.{mode}&score={op}',
+                         extra={'Prefer': 'count=exact'})
+        return int(res.headers['Content-Range'].split('/')[1]) + 1
+
+
+def random_row(rng):
+    mode = rng.choice(MODES)
+    # Slalom scores are times (lower is better), free run is points
+    score = rng.randint(20_000, 180_000) if mode == 'slalom' else int(rng.paretovariate(1.2) * 1000)
+    return {
+        'player_name': f'{rng.choice(NAMES)}{rng.randint(1, 999)}',
+        'score': min(score, 9_999_999),
+        'distance': rng.randint(0, 5000),
+        'mode': mode,
+        'tokens_collected': rng.randint(0, 200),
+        'best_combo': rng.randint(1, 5),
+    }
+
+
+def seed(client, n, rng, chunk=1000):
+    """Bulk-insert n random scores before the timed run."""
+    t0 = time.perf_counter()
+    for i in range(0, n, chunk):
+        client.submit([random_row(rng) for _ in range(min(chunk, n - i))])
+    print(f'Seeded {n} scores in {time.perf_counter() - t0:.1f}s')
+
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * p / 100))]
+
+
+def worker(client, deadline, mix, rng, results, lock):
+    ops = [op for op, _ in mix]
+    weights = [w for _, w in mix]
+    local = {op: [] for op in ops}
+    errors = 0
+    while time.perf_counter() < deadline:
+        op = rng.choices(ops, weights)[0]
+        row = random_row(rng)
+        t0 = time.perf_counter()
+        try:
+            if op == 'submit':
+                client.submit(row)
+            elif op == 'top':
+                client.top(row['mode'])
+            else:
+                client.rank(row['score'], row['mode'])
+        except (HTTPError, URLError, OSError):
+            errors += 1
+            continue
+        local[op].append(time.perf_counter() - t0)
+    with lock:
+        for op, samples in local.items():
+            results.setdefault(op, []).extend(samples)
+        results['_errors'] = results.get('_errors', 0) + errors
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Load-test a SkiAvax leaderboard endpoint.')
+    ap.add_argument('--url', default='http://127.0.0.1:54321', help='server base URL')
+    ap.add_argument('--key', default='local-dev', help='apikey header value')
+    ap.add_argument('--workers', type=int, default=8)
+    ap.add_argument('--duration', type=float, default=10.0, help='seconds')
+    ap.add_argument('--seed', type=int, default=0, help='scores to bulk-insert first')
+    ap.add_argument('--mix', default='submit=1,top=3,rank=1',
+                    help='relative op weights (default: submit=1,top=3,rank=1)')
+    ap.add_argument('--random-seed', type=int, default=1)
+    args = ap.parse_args(argv)
+
+    try:
+        mix = [(op, float(w)) for op, w in (part.split('=') for part in args.mix.split(','))]
+    except ValueError:
+        print(f'❌ Error: bad --mix {args.mix!r}')
+        return 2
+    if any(op not in ('submit', 'top', 'rank') for op, _ in mix):
+        print('❌ Error: --mix ops must be submit, top or rank')
+        return 2
+
+    rng = random.Random(args.random_seed)
+    client = Client(args.url, args.key)
+    try:
+        if args.seed:
+            seed(client, args.seed, rng)
+        client.top('freerun')
+    except (HTTPError, URLError, OSError) as e:
+        print(f'❌ Error: cannot reach {args.url}: {e}')
+        return 1
+
+    results, lock = {}, threading.Lock()
+    deadline = time.perf_counter() + args.duration
+    threads = [threading.Thread(target=worker,
+                                args=(client, deadline, mix, random.Random(rng.random()), results, lock))
+               for _ in range(args.workers)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    errors = results.pop('_errors', 0)
+    total = sum(len(v) for v in results.values())
+    print(f'{total} requests in {args.duration:.0f}s with {args.workers} workers '
+          f'({total / args.duration:.0f} req/s, {errors} errors)')
+    print(f"{'op':<8} {'count':>7} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+    for op, samples in sorted(results.items()):
+        samples.sort()
+        row = [percentile(samples, p) * 1000 for p in (50, 95, 99)] + [samples[-1] * 1000 if samples else 0]
+        print(f'{op:<8} {len(samples):>7} ' + ' '.join(f'{v:>8.2f}' for v in row))
+    return 1 if errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,449 @@
+#!/usr/bin/env python3
+"""
+SkiAvax Local Leaderboard Server
+A stdlib stand-in for the Supabase REST API used by js/LeaderboardManager.js,
+so leaderboard latency can be tested offline and the game pointed at it
+during development.
+
+Serves the same /rest/v1/scores endpoints (the PostgREST subset the game
+uses), backed by SQLite with the schema and constraints of supabase_setup.sql:
+
+  - inserts from concurrent requests are group-committed in batches
+  - an in-memory sorted score index per mode answers rank/count queries in
+    O(log n) instead of scanning matching rows
+  - top-N pages are cached per mode and only dropped when a new score lands
+    inside the cached page
+
+    python3 leaderboard_server.py                 # http://localhost:54321
+    then open the game with ?leaderboard=http://localhost:54321
+
+API keys are accepted but not checked: this is a development server only.
+"""
+import argparse
+import bisect
+import json
+import queue
+import re
+import sqlite3
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qsl, urlsplit
+
+ROOT_DIR = Path(__file__).parent
+DEFAULT_DB = ROOT_DIR / 'leaderboard.db'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    id               INTEGER PRIMARY KEY AUTOINCREMENT,
+    player_name      TEXT    NOT NULL CHECK (length(player_name) BETWEEN 1 AND 20),
+    score            INTEGER NOT NULL CHECK (score >= 0 AND score < 10000000),
+    distance         INTEGER NOT NULL DEFAULT 0,
+    mode             TEXT    NOT NULL CHECK (mode IN ('freerun', 'slalom')),
+    tokens_collected INTEGER NOT NULL DEFAULT 0,
+    best_combo       INTEGER NOT NULL DEFAULT 1,
+    created_at       TEXT    NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%fZ', 'now'))
+);
+CREATE INDEX IF NOT EXISTS idx_scores_mode_score ON scores (mode, score);
+"""
+
+COLUMNS = ('id', 'player_name', 'score', 'distance', 'mode',
+           'tokens_collected', 'best_combo', 'created_at')
+INSERT_COLUMNS = ('player_name', 'score', 'distance', 'mode', 'tokens_collected', 'best_combo')
+MODES = ('freerun', 'slalom')
+OPS = {'eq': '=', 'neq': '!=', 'gt': '>', 'gte': '>=', 'lt': '<', 'lte': '<='}
+ORDER_RE = re.compile(r'^(\w+)(?:\.(asc|desc))?(?:\.nulls(?:first|last))?$')
+INT_MIN, INT_MAX = -2 ** 31, 2 ** 31 - 1   # Postgres INTEGER, as in supabase_setup.sql
+MAX_BODY = 8 * 1024 * 1024
+
+
+class ApiError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def validate(row):
+    """Check a submitted row against the table constraints; return insert values."""
+    if not isinstance(row, dict):
+        raise ApiError(400, 'each row must be a JSON object')
+    unknown = set(row) - set(INSERT_COLUMNS)
+    if unknown:
+        raise ApiError(400, f'unknown column(s): {", ".join(sorted(unknown))}')
+    name, score, mode = row.get('player_name'), row.get('score'), row.get('mode')
+    if not isinstance(name, str) or not 1 <= len(name) <= 20:
+        raise ApiError(400, 'player_name must be 1-20 characters')
+    if not isinstance(score, int) or isinstance(score, bool) or not 0 <= score < 10_000_000:
+        raise ApiError(400, 'score must be an integer in [0, 10000000)')
+    if mode not in MODES:
+        raise ApiError(400, f'mode must be one of {MODES}')
+    values = [name, score]
+    for col, default in (('distance', 0), ('tokens_collected', 0), ('best_combo', 1)):
+        v = row.get(col, default)
+        if not isinstance(v, int) or isinstance(v, bool) or not INT_MIN <= v <= INT_MAX:
+            raise ApiError(400, f'{col} must be an integer in [{INT_MIN}, {INT_MAX}]')
+        values.append(v)
+    values.insert(3, mode)
+    return tuple(values)
+
+
+class ScoreStore:
+    """SQLite-backed scores table with a batch writer and per-mode rank index."""
+
+    def __init__(self, path, batch_size=256, flush_interval=0.005):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        # Autocommit mode: transactions are managed explicitly by _commit()
+        self._db = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._db.row_factory = sqlite3.Row
+        if str(path) != ':memory:':
+            self._db.execute('PRAGMA journal_mode=WAL')
+            self._db.execute('PRAGMA synchronous=NORMAL')
+        self._db.executescript(SCHEMA)
+        self._db_lock = threading.Lock()
+        self._index_lock = threading.Lock()
+
+        # Ascending score list per mode; rank = bisect into it
+        self._scores = {mode: [] for mode in MODES}
+        for mode in MODES:
+            rows = self._db.execute('SELECT score FROM scores WHERE mode = ? ORDER BY score', (mode,))
+            self._scores[mode] = [r[0] for r in rows]
+
+        # (mode, select, order, limit, offset) → (JSON body, total rows)
+        self._pages = {}
+
+        self._pending = queue.Queue()
+        self._writer = threading.Thread(target=self._write_loop, name='score-writer', daemon=True)
+        self._writer.start()
+
+    # ── Writes ──────────────────────────────────────────────────────────────
+    def insert(self, rows):
+        """Queue validated rows and block until their batch is committed; return ids."""
+        done = threading.Event()
+        job = {'rows': [validate(r) for r in rows], 'done': done, 'ids': None, 'error': None}
+        self._pending.put(job)
+        done.wait()
+        if job['error']:
+            raise job['error']
+        return job['ids']
+
+    def _write_loop(self):
+        while True:
+            jobs = [self._pending.get()]
+            deadline = time.monotonic() + self.flush_interval
+            count = len(jobs[0]['rows'])
+            while count < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    job = self._pending.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                jobs.append(job)
+                count += len(job['rows'])
+            self._commit(jobs)
+
+    def _commit(self, jobs):
+        """Insert a batch of jobs in one transaction; each job succeeds or fails alone.
+
+        Whatever goes wrong, every job's done event is set on the way out so
+        no request thread is left waiting on a batch that will never finish.
+        """
+        sql = f'INSERT INTO scores ({", ".join(INSERT_COLUMNS)}) VALUES (?, ?, ?, ?, ?, ?)'
+        committed = []
+        try:
+            with self._db_lock:
+                self._db.execute('BEGIN')
+                try:
+                    for job in jobs:
+                        self._db.execute('SAVEPOINT job')
+                        try:
+                            job['ids'] = [self._db.execute(sql, row).lastrowid for row in job['rows']]
+                        except (sqlite3.Error, OverflowError) as e:
+                            self._db.execute('ROLLBACK TO job')
+                            self._db.execute('RELEASE job')
+                            job['ids'] = None
+                            job['error'] = ApiError(409 if isinstance(e, sqlite3.IntegrityError) else
+                                                    400 if isinstance(e, OverflowError) else 500, str(e))
+                            continue
+                        self._db.execute('RELEASE job')
+                        committed.append(job)
+                    self._db.execute('COMMIT')
+                except BaseException:
+                    if self._db.in_transaction:
+                        self._db.execute('ROLLBACK')
+                    raise
+            with self._index_lock:
+                for job in committed:
+                    for row in job['rows']:
+                        self._index(row[3], row[1])
+        except Exception as e:
+            for job in jobs:
+                job['error'] = job['error'] or ApiError(500, f'score batch failed: {e}')
+        finally:
+            for job in jobs:
+                job['done'].set()
+
+    def _index(self, mode, score):
+        """Add a committed score to the index and drop cached pages it lands in."""
+        scores = self._scores[mode]
+        bisect.insort(scores, score)
+        # Position of the new row in each order (ties sort by id, so it goes last)
+        position = {'desc': len(scores) - bisect.bisect_left(scores, score) - 1,
+                    'asc': bisect.bisect_right(scores, score) - 1}
+        for key in [k for k in self._pages if k[0] == mode]:
+            _, _, order, limit, offset = key
+            if order not in position or limit is None or position[order] < offset + limit:
+                del self._pages[key]
+
+    # ── Reads ───────────────────────────────────────────────────────────────
+    def count(self, mode, op=None, value=None):
+        """Rows in mode matching `score <op> value`, from the index in O(log n)."""
+        with self._index_lock:
+            s = self._scores[mode]
+            if op is None:
+                return len(s)
+            if op == 'gt':
+                return len(s) - bisect.bisect_right(s, value)
+            if op == 'gte':
+                return len(s) - bisect.bisect_left(s, value)
+            if op == 'lt':
+                return bisect.bisect_left(s, value)
+            if op == 'lte':
+                return bisect.bisect_right(s, value)
+            if op == 'eq':
+                return bisect.bisect_right(s, value) - bisect.bisect_left(s, value)
+            return len(s) - (bisect.bisect_right(s, value) - bisect.bisect_left(s, value))
+
+    def page(self, mode, select, order, limit, offset):
+        """Cached leaderboard page ordered by score; returns (JSON body, rows in mode)."""
+        key = (mode, select, order, limit, offset)
+        with self._index_lock:
+            hit = self._pages.get(key)
+            total = len(self._scores[mode])
+        if hit is not None:
+            return hit[0], total
+        rows = self.query(select, [('mode', 'eq', mode)], [('score', order)], limit, offset)
+        body = json.dumps(rows).encode()
+        with self._index_lock:
+            # Only cache if no insert into this mode slipped in meanwhile
+            if len(self._scores[mode]) == total:
+                self._pages[key] = (body, total)
+        return body, total
+
+    def query(self, select, filters, order, limit, offset):
+        """General SELECT for requests the index and page cache don't cover."""
+        where, args = [], []
+        for col, op, value in filters:
+            where.append(f'{col} {OPS[op]} ?')
+            args.append(value)
+        sql = f'SELECT {", ".join(select)} FROM scores'
+        if where:
+            sql += ' WHERE ' + ' AND '.join(where)
+        sql += ' ORDER BY ' + ', '.join(f'{c} {d.upper()}' for c, d in order + [('id', 'asc')])
+        if limit is not None:
+            sql += ' LIMIT ? OFFSET ?'
+            args += [limit, offset]
+        with self._db_lock:
+            return [dict(r) for r in self._db.execute(sql, args)]
+
+    def total(self, filters):
+        where = ' AND '.join(f'{c} {OPS[op]} ?' for c, op, _ in filters) or '1'
+        with self._db_lock:
+            return self._db.execute(f'SELECT COUNT(*) FROM scores WHERE {where}',
+                                    [v for _, _, v in filters]).fetchone()[0]
+
+
+def parse_query(qs):
+    """Parse the PostgREST subset the game uses into (select, filters, order, limit, offset)."""
+    select, filters, order, limit, offset = list(COLUMNS), [], [], None, 0
+    for name, value in parse_qsl(qs, keep_blank_values=True):
+        if name == 'select':
+            select = list(COLUMNS) if value in ('', '*') else value.split(',')
+            bad = [c for c in select if c not in COLUMNS]
+            if bad:
+                raise ApiError(400, f'unknown column(s) in select: {", ".join(bad)}')
+        elif name == 'order':
+            for part in value.split(','):
+                m = ORDER_RE.match(part)
+                if not m or m.group(1) not in COLUMNS:
+                    raise ApiError(400, f'bad order: {part}')
+                order.append((m.group(1), m.group(2) or 'asc'))
+        elif name in ('limit', 'offset'):
+            try:
+                n = int(value)
+            except ValueError:
+                raise ApiError(400, f'{name} must be an integer')
+            if n < 0:
+                raise ApiError(400, f'{name} must be >= 0')
+            if name == 'limit':
+                limit = n
+            else:
+                offset = n
+        elif name in COLUMNS:
+            op, _, raw = value.partition('.')
+            if op not in OPS:
+                raise ApiError(400, f'unsupported operator: {op}')
+            arg = raw
+            if name in ('id', 'score', 'distance', 'tokens_collected', 'best_combo'):
+                try:
+                    arg = int(raw)
+                except ValueError:
+                    raise ApiError(400, f'{name} must be compared with an integer')
+            filters.append((name, op, arg))
+        else:
+            raise ApiError(400, f'unknown parameter: {name}')
+    return select, filters, order, limit, offset
+
+
+class Handler(BaseHTTPRequestHandler):
+    server_version = 'SkiAvaxLeaderboard/1.0'
+    protocol_version = 'HTTP/1.1'
+    store = None      # ScoreStore, set by main()
+    quiet = False
+
+    def log_message(self, fmt, *args):
+        if not self.quiet:
+            super().log_message(fmt, *args)
+
+    def _send(self, status, body=b'', headers=None):
+        self.send_response(status)
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_header('Access-Control-Expose-Headers', 'Content-Range')
+        if body:
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        if self.close_connection:
+            self.send_header('Connection', 'close')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if body and self.command != 'HEAD':
+            self.wfile.write(body)
+
+    def _error(self, e):
+        self._send(e.status, json.dumps({'message': str(e)}).encode())
+
+    def _route(self):
+        url = urlsplit(self.path)
+        if url.path.rstrip('/') != '/rest/v1/scores':
+            raise ApiError(404, f'no such endpoint: {url.path}')
+        return url.query
+
+    def _prefers(self, token):
+        return token in self.headers.get('Prefer', '')
+
+    def do_OPTIONS(self):
+        self._send(204, headers={
+            'Access-Control-Allow-Methods': 'GET, HEAD, POST, OPTIONS',
+            'Access-Control-Allow-Headers': 'apikey, authorization, content-type, prefer, range',
+            'Access-Control-Max-Age': '86400',
+        })
+
+    def do_HEAD(self):
+        self.do_GET()
+
+    def do_GET(self):
+        head = self.command == 'HEAD'
+        try:
+            select, filters, order, limit, offset = parse_query(self._route())
+            want_count = self._prefers('count=exact')
+            by_col = {c: (op, v) for c, op, v in filters}
+            mode = by_col.get('mode', (None, None))
+            mode = mode[1] if mode[0] == 'eq' and mode[1] in MODES else None
+            indexed = mode and len(filters) == len(by_col) and set(by_col) <= {'mode', 'score'}
+
+            if indexed and (head or limit == 0):
+                # Rank / count query: answered from the index without touching rows
+                op, value = by_col.get('score', (None, None))
+                total = self.store.count(mode, op, value)
+                body, rows = (b'' if head else b'[]'), 0
+            elif indexed and 'score' not in by_col and len(order) == 1 \
+                    and order[0][0] == 'score' and limit is not None:
+                body, total = self.store.page(mode, tuple(select), order[0][1], limit, offset)
+                rows = None
+            else:
+                result = self.store.query(select, filters, order, limit, offset)
+                body, rows = json.dumps(result).encode(), len(result)
+                total = self.store.total(filters) if want_count else None
+
+            if rows is None:
+                rows = min(limit, max(0, total - offset))
+            span = f'{offset}-{offset + rows - 1}' if rows else '*'
+            content_range = f'{span}/{total if want_count else "*"}'
+            self._send(200, body, {'Content-Range': content_range})
+        except ApiError as e:
+            self._error(e)
+
+    def _read_body(self):
+        """Read the request body, or mark the connection for closing if it can't be.
+
+        The body is always consumed before routing, so an error response on a
+        keep-alive connection never leaves unread bytes to be parsed as the
+        next request.
+        """
+        if 'chunked' in self.headers.get('Transfer-Encoding', '').lower():
+            self.close_connection = True
+            raise ApiError(411, 'Content-Length required')
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+        except ValueError:
+            self.close_connection = True
+            raise ApiError(400, 'Content-Length must be an integer')
+        if length < 0 or length > MAX_BODY:
+            self.close_connection = True
+            raise ApiError(413 if length > 0 else 400, f'Content-Length must be in [0, {MAX_BODY}]')
+        return self.rfile.read(length)
+
+    def do_POST(self):
+        try:
+            body = self._read_body()
+            self._route()
+            try:
+                payload = json.loads(body or b'null')
+            except ValueError:
+                raise ApiError(400, 'body must be JSON')
+            rows = payload if isinstance(payload, list) else [payload]
+            ids = self.store.insert(rows)
+            if self._prefers('return=representation'):
+                result = [self.store.query(list(COLUMNS), [('id', 'eq', i)], [], None, 0)[0] for i in ids]
+                self._send(201, json.dumps(result if isinstance(payload, list) else result[0]).encode())
+            else:
+                self._send(201)
+        except ApiError as e:
+            self._error(e)
+
+
+class Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128   # default of 5 drops bursts of connections (1s SYN retry)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Local SkiAvax leaderboard (Supabase REST stand-in).')
+    ap.add_argument('--host', default='127.0.0.1')
+    ap.add_argument('--port', type=int, default=54321)
+    ap.add_argument('--db', default=str(DEFAULT_DB), help="SQLite file, or ':memory:'")
+    ap.add_argument('--batch-size', type=int, default=256, help='max rows per insert transaction')
+    ap.add_argument('--flush-ms', type=float, default=5.0,
+                    help='how long the writer waits to fill a batch (default: 5)')
+    ap.add_argument('--quiet', action='store_true', help='no per-request logging')
+    args = ap.parse_args(argv)
+
+    Handler.store = ScoreStore(args.db, args.batch_size, args.flush_ms / 1000)
+    Handler.quiet = args.quiet
+    server = Server((args.host, args.port), Handler)
+    counts = ', '.join(f'{m}: {Handler.store.count(m)}' for m in MODES)
+    print(f'🏔  SkiAvax leaderboard on http://{args.host}:{args.port}/rest/v1/scores ({counts})')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print('\nStopped.')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())